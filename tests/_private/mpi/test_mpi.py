@@ -24,11 +24,10 @@ def test_get_hosts():
 
 
 @pytest.mark.run_generax
-def test_get_num_slots():
+def test_get_num_slots(mpi_slots):
 
     # This should work for any system with more tha one core. 
-    num_slots = get_num_slots()
-    assert num_slots > 1
+    assert mpi_slots > 1
 
     # Enforce a single slot with an environment variable
     with mock.patch.dict(os.environ, {'TOPIARY_MAX_SLOTS': '1'}):
@@ -37,15 +36,78 @@ def test_get_num_slots():
 
 
 @pytest.mark.run_generax
-def test_check_mpi_configuration():
+def test_check_mpi_configuration(mpi_slots):
 
     # This should run fine
     check_mpi_configuration(1)
 
-    # This should run fine (assuming test environment has more than one slot)
-    check_mpi_configuration(2)
+    # This should run fine if the test environment has more than one slot
+    if mpi_slots > 1:
+        check_mpi_configuration(2)
+
+    # Use slots we already found
+    check_mpi_configuration(-1,num_slots=mpi_slots)
 
     # An unlikely number of slots. If this test ever passes, we've reached the
     # singularity and this code does not matter anyway
     with pytest.raises(RuntimeError):
         check_mpi_configuration(1000000)
+
+def test_check_mpi_configuration_num_slots():
+
+    # If we pass in num_slots, mpirun should not be run for any num_threads
+    # up to num_slots.
+    with mock.patch("topiary._private.mpi.mpi.get_hosts") as get_hosts_mock:
+        with mock.patch("topiary._private.mpi.mpi.get_num_slots") as slots_mock:
+
+            check_mpi_configuration(2,num_slots=4)
+            check_mpi_configuration(4,num_slots=4)
+            check_mpi_configuration(-1,num_slots=4)
+            assert get_hosts_mock.call_count == 0
+            assert slots_mock.call_count == 0
+
+            # More threads than num_slots --> check with mpirun
+            check_mpi_configuration(5,num_slots=4)
+            assert get_hosts_mock.call_count == 1
+            assert slots_mock.call_count == 0
+
+            # No num_slots --> check with mpirun
+            check_mpi_configuration(2)
+            assert get_hosts_mock.call_count == 2
+            assert slots_mock.call_count == 0
+
+            # No num_slots, num_threads -1 --> figure out number of slots. That
+            # already ran mpirun, so do not run it again.
+            slots_mock.return_value = 3
+            check_mpi_configuration(-1)
+            assert slots_mock.call_count == 1
+            assert get_hosts_mock.call_count == 2
+
+def test_get_num_slots_capped():
+
+    def fake_get_hosts(num_slots):
+        if num_slots > 1:
+            raise RuntimeError
+        return ["n001"]
+
+    with mock.patch("topiary._private.mpi.mpi.get_hosts") as get_hosts_mock:
+        get_hosts_mock.side_effect = fake_get_hosts
+
+        # Cap above what works. Capped count must be probed, so we should only
+        # get a slot count mpirun actually ran with.
+        with mock.patch.dict(os.environ, {'TOPIARY_MAX_SLOTS': '2'}):
+            num_slots = get_num_slots()
+        assert num_slots == 1
+        assert [c.args[0] for c in get_hosts_mock.call_args_list] == [1,2]
+
+        # num_threads above the slots found is still checked with mpirun
+        with pytest.raises(RuntimeError):
+            check_mpi_configuration(2,num_slots=num_slots)
+
+        # All slot counts work; stop at (and probe) the cap
+        get_hosts_mock.reset_mock()
+        get_hosts_mock.side_effect = None
+        with mock.patch.dict(os.environ, {'TOPIARY_MAX_SLOTS': '3'}):
+            num_slots = get_num_slots()
+        assert num_slots == 3
+        assert [c.args[0] for c in get_hosts_mock.call_args_list] == [1,2,3]
@@ -26,6 +26,28 @@ def pytest_addoption(parser):
                      default=False,
                      help="Run tests involving blast")
 
+def pytest_configure(config):
+    """
+    Root tmpdir/tmp_path on a RAM-backed filesystem (/dev/shm) if the platform
+    has one. Many tests write small files and immediately read them back; this
+    avoids the disk round trip. This only changes the temporary root, so
+    pytest still creates, locks, and cleans up its usual numbered
+    pytest-of-<user>/pytest-N directories. Respects --basetemp and an existing
+    PYTEST_DEBUG_TEMPROOT.
+    """
+
+    if config.option.basetemp is not None:
+        return
+
+    if "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+
+    shm = os.path.join(os.sep,"dev","shm")
+    if not os.path.isdir(shm) or not os.access(shm,os.W_OK | os.X_OK):
+        return
+
+    os.environ["PYTEST_DEBUG_TEMPROOT"] = shm
+
 def pytest_collection_modifyitems(config, items):
     """
     Look for run_generax and run_raxml decorators. Modify test collection based
@@ -267,6 +289,17 @@ class HTMLValidator(HTMLParser):
         
         return self._tag_dict
 
+@pytest.fixture(scope="session")
+def mpi_slots():
+    """
+    Number of mpi slots available. Probing this launches mpirun repeatedly,
+    so only do it once per session.
+    """
+
+    from topiary._private.mpi import get_num_slots
+
+    return get_num_slots()
+
 @pytest.fixture(scope="module")
 def ncbi_lines():
     """
@@ -2,6 +2,112 @@
 import pytest
 
 import topiary
+from topiary.draw.tree import _scale_size
+from topiary.draw.tree import _cached_load_trees
+from topiary.draw.tree import _get_newick_stamp
+
+import numpy as np
+
+import os
+import shutil
+import sys
+from unittest import mock
 
 def test_tree():
     pass
+
+def test__get_newick_stamp(small_phylo,tmpdir):
+
+    assert _get_newick_stamp(None) == ()
+
+    out_dir = small_phylo["02_gene-tree-ancestors/output"]
+    for f in ["gene-tree.newick","gene-tree_anc-pp.newick","dataframe.csv"]:
+        shutil.copy(os.path.join(out_dir,f),tmpdir)
+
+    # Only newick files, sorted by name
+    stamp = _get_newick_stamp(tmpdir)
+    assert [os.path.basename(s[0]) for s in stamp] == ["gene-tree.newick",
+                                                       "gene-tree_anc-pp.newick"]
+    assert _get_newick_stamp(tmpdir) == stamp
+
+    # Rewrite a newick file --> stamp changes
+    newick = os.path.join(tmpdir,"gene-tree.newick")
+    with open(newick) as f:
+        contents = f.read()
+    with open(newick,"w") as f:
+        f.write(contents)
+    mtime = os.stat(newick).st_mtime_ns
+    os.utime(newick,ns=(mtime,mtime + 1000))
+    assert _get_newick_stamp(tmpdir) != stamp
+
+    # Change a non-newick file --> stamp does not change
+    stamp = _get_newick_stamp(tmpdir)
+    with open(os.path.join(tmpdir,"dataframe.csv"),"a") as f:
+        f.write("\n")
+    assert _get_newick_stamp(tmpdir) == stamp
+
+def test__cached_load_trees(small_phylo,tmpdir):
+
+    _cached_load_trees.cache_clear()
+
+    calc_dir = os.path.join(tmpdir,"calc")
+    shutil.copytree(small_phylo["02_gene-tree-ancestors"],calc_dir)
+    out_dir = os.path.join(calc_dir,"output")
+
+    # Cache hit --> same object
+    T = _cached_load_trees(out_dir,"gene",_get_newick_stamp(out_dir))
+    assert T is not None
+    assert _cached_load_trees(out_dir,"gene",_get_newick_stamp(out_dir)) is T
+    expected = T.write(format=1,features=[])
+
+    # Drawing works on a copy and leaves the cached tree unchanged
+    # (topiary.draw.tree is the function, so get the module from sys.modules)
+    tree_module = sys.modules["topiary.draw.tree"]
+    with mock.patch.object(tree_module,"PrettyTree",
+                           wraps=tree_module.PrettyTree) as pretty_tree_mock:
+        topiary.draw.tree(calc_dir,output_file=os.path.join(tmpdir,"tree.pdf"))
+        drawn_T = pretty_tree_mock.call_args.args[0]
+
+    assert drawn_T is not T
+    assert _cached_load_trees(out_dir,"gene",_get_newick_stamp(out_dir)) is T
+    assert T.write(format=1,features=[]) == expected
+
+    drawn_T.children[0].dist = 1000
+    assert T.write(format=1,features=[]) == expected
+
+    # Rewrite a newick file --> tree is re-read
+    newick = os.path.join(out_dir,"gene-tree.newick")
+    mtime = os.stat(newick).st_mtime_ns
+    os.utime(newick,ns=(mtime,mtime + 1000))
+    T_new = _cached_load_trees(out_dir,"gene",_get_newick_stamp(out_dir))
+    assert T_new is not T
+    assert T_new.write(format=1,features=[]) == expected
+
+def test__scale_size():
+
+    # single value
+    assert _scale_size(10,1.5) == 15
+    assert _scale_size(10.0,0.6) == 6.0
+
+    # dict -- new dict with scaled values, input not modified
+    size = {"D":10,"L":20}
+    out = _scale_size(size,1.5)
+    assert out == {"D":15,"L":30}
+    assert out is not size
+    assert size == {"D":10,"L":20}
+
+    # list-like --> numpy array
+    out = _scale_size([10,20],0.5)
+    assert isinstance(out,np.ndarray)
+    assert np.array_equal(out,[5,10])
+
+    out = _scale_size((10,20),0.5)
+    assert isinstance(out,np.ndarray)
+    assert np.array_equal(out,[5,10])
+
+    # numpy array -- new array, input not modified
+    size = np.array([10,20])
+    out = _scale_size(size,0.5)
+    assert out is not size
+    assert np.array_equal(out,[5,10])
+    assert np.array_equal(size,[10,20])
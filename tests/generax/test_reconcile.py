@@ -2,6 +2,7 @@ import pytest
 import topiary
 
 from topiary.generax.reconcile import reconcile
+from topiary.generax.reconcile import _assert_binary_available
 from topiary.generax import GENERAX_BINARY
 from topiary.raxml import RAXML_BINARY
 from topiary._private import Supervisor
@@ -10,6 +11,32 @@ import os
 import copy
 import json
 import shutil
+import sys
+from unittest import mock
+
+def test__assert_binary_available():
+
+    _assert_binary_available.cache_clear()
+
+    # Any executable in the path works for this check
+    _assert_binary_available(sys.executable,"python")
+
+    # Cache hit --> binary is not looked up or run again
+    with mock.patch("topiary.generax.reconcile.subprocess.run") as run_mock:
+        with mock.patch("topiary.generax.reconcile.shutil.which") as which_mock:
+            _assert_binary_available(sys.executable,"python")
+            assert run_mock.call_count == 0
+            assert which_mock.call_count == 0
+
+    # Not found by which --> fall back to running it
+    with mock.patch("topiary.generax.reconcile.subprocess.run") as run_mock:
+        _assert_binary_available("not_a_binary_but_runs","generax")
+        assert run_mock.call_count == 1
+
+    with pytest.raises(ValueError,match="raxml"):
+        _assert_binary_available("not_a_binary","raxml")
+
+    _assert_binary_available.cache_clear()
 
 @pytest.mark.run_generax
 def test_reconcile(small_phylo,tmpdir):
@@ -9,6 +9,7 @@ import pandas as pd
 
 import os
 import re
+import pathlib
 
 
 def test__validate_seq_writer():
@@ -22,26 +23,68 @@ def test__validate_seq_writer():
     return None
 
 
+# Bad values for arguments shared by write_fasta and write_phy.
+_BAD_WRITER_ARGS = {
+    "out_file":[None,1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                str,(1,2)],
+    "seq_column":[1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                  str,(1,2),"not_in_df"],
+    "label_columns":[None,1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                     str,(1,2)],
+    "write_only_keepers":[None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                          str,(1,2),"something"],
+    "empty_char":[1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                  str,(1,2),True],
+    "clean_sequence":[None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                      str,(1,2),"something"],
+    "overwrite":[None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
+                 str,(1,2),"something"],
+}
+
+def _bad_writer_params(arg_names):
+    """
+    Build a flat list of pytest.param(arg,bad_value) from _BAD_WRITER_ARGS.
+    """
+
+    params = []
+    for arg in arg_names:
+        for i, bad_value in enumerate(_BAD_WRITER_ARGS[arg]):
+            params.append(pytest.param(arg,bad_value,id=f"{arg}-{i}"))
+
+    return params
+
+def _check_bad_writer_arg(writer,df,out_file,arg,bad_value):
+    """
+    Make sure writer raises a ValueError naming arg when it is set to
+    bad_value.
+    """
+
+    kwargs = {"out_file":out_file}
+    kwargs[arg] = bad_value
+
+    # Error should name the bad argument. (Bad entries within label_columns
+    # are reported as 'label_column', hence the rstrip.)
+    with pytest.raises(ValueError,match=arg.rstrip("s")):
+        writer(df,**kwargs)
+
+
 def test_write_fasta(test_dataframes,tmpdir):
 
     def _check_output_file(out_file,num_columns,check_length=None):
 
-        f = open(out_file)
-        lines = f.readlines()
-        f.close()
+        text = pathlib.Path(out_file).read_text()
 
-        has_gap = False
-        for l in lines:
-            if l.startswith(">"):
-                col = l[1:].split("|")
-                assert len(col) == num_columns
-                assert len(col[0]) == 10
-            else:
-                if re.search("-",l):
-                    has_gap = True
+        headers = re.findall(r"^>(.*)$",text,re.MULTILINE)
+        for h in headers:
+            col = h.split("|")
+            assert len(col) == num_columns
+            assert len(col[0]) == 10
+
+        seqs = re.findall(r"^[^>].*$",text,re.MULTILINE)
+        has_gap = any("-" in s for s in seqs)
 
         if check_length is not None:
-            assert len(lines) == check_length*2
+            assert len(text.splitlines()) == check_length*2
 
         return has_gap
 
@@ -52,15 +95,6 @@ def test_write_fasta(test_dataframes,tmpdir):
     io.write_fasta(df,out_file)
     _check_output_file(out_file,num_columns=3)
 
-    # -------------------------------------------------------------------------
-    # output files
-
-    bad_output_files = [None,1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                        str,(1,2)]
-    for b in bad_output_files:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,b)
-
     # -------------------------------------------------------------------------
     # seq_column
 
@@ -79,21 +113,9 @@ def test_write_fasta(test_dataframes,tmpdir):
     has_gaps = _check_output_file(out_file,num_columns=3)
     assert not has_gaps
 
-    bad_seq_columns = [1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                        str,(1,2),"not_in_df"]
-    for b in bad_seq_columns:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,seq_column=b)
-
     # -------------------------------------------------------------------------
     # columns
 
-    bad_columns = [None,1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2)]
-    for b in bad_columns:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,label_columns=b)
-
     os.remove(out_file)
     io.write_fasta(df,out_file,label_columns=["start"])
     has_gaps = _check_output_file(out_file,num_columns=2)
@@ -101,14 +123,9 @@ def test_write_fasta(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # write_only_keepers
 
-    bad_write_only = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_write_only:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,write_only_keepers=b)
-
-    no_keep_df = df.copy()
-    no_keep_df.loc[1:,"keep"] = False
+    new_keep = df["keep"].copy()
+    new_keep.loc[1:] = False
+    no_keep_df = df.assign(keep=new_keep)
     os.remove(out_file)
     io.write_fasta(no_keep_df,out_file,write_only_keepers=True)
     has_gaps = _check_output_file(out_file,num_columns=3,check_length=1)
@@ -121,12 +138,6 @@ def test_write_fasta(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # empty_char
 
-    bad_empty = [1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                 str,(1,2),True]
-    for b in bad_empty:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,empty_char=b)
-
     # Should throw runtime error because sequences all look empty!
     with pytest.raises(RuntimeError):
         io.write_fasta(df,out_file=out_file,empty_char="ACDEFGHIKLMNPQRSTVWYZ-")
@@ -134,15 +145,8 @@ def test_write_fasta(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # clean_sequence
 
-    bad_clean = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_clean:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,clean_sequence=b)
-
-    to_clean_df = df.copy()
-    to_clean_df.loc[:,"sequence"] = "STUPIDX?STUPID"
-    to_clean_df.loc[:,"length"] = len("STUPIDX?STUPID")
+    to_clean_df = df.assign(sequence="STUPIDX?STUPID",
+                            length=len("STUPIDX?STUPID"))
     io.write_fasta(to_clean_df,out_file=out_file,clean_sequence=True,seq_column="sequence")
     f = open(out_file)
     lines = f.readlines()
@@ -152,12 +156,6 @@ def test_write_fasta(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # overwrite
 
-    bad_overwrite = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_overwrite:
-        with pytest.raises(ValueError):
-            io.write_fasta(df,out_file=out_file,overwrite=b)
-
     os.remove(out_file)
     io.write_fasta(df,out_file)
     # Should throw error because overwrite is False by default
@@ -174,13 +172,23 @@ def test_write_fasta(test_dataframes,tmpdir):
     # IMPROVE TEST
     # NEED TO TEST TAXONOMIC ORDERING
 
+@pytest.mark.parametrize("arg,bad_value",
+                         _bad_writer_params(["out_file","seq_column",
+                                             "label_columns",
+                                             "write_only_keepers",
+                                             "empty_char","clean_sequence",
+                                             "overwrite"]))
+def test_write_fasta_bad_args(test_dataframes,tmpdir,arg,bad_value):
+
+    df = test_dataframes["good-df_with-good-alignment"]
+    _check_bad_writer_arg(io.write_fasta,df,os.path.join(tmpdir,"output.fasta"),
+                          arg,bad_value)
+
 def test_write_phy(test_dataframes,tmpdir):
 
     def _check_output_file(out_file,check_length=None):
 
-        f = open(out_file)
-        lines = f.readlines()
-        f.close()
+        lines = pathlib.Path(out_file).read_text().splitlines()
 
         header = lines[0].split()
         num_seqs = int(header[0])
@@ -198,7 +206,7 @@ def test_write_phy(test_dataframes,tmpdir):
                 counter += 1
             else:
                 assert len(l.strip()) == seq_length
-                if re.search("-",l):
+                if "-" in l:
                     has_gap = True
 
                 counter = 0
@@ -212,15 +220,6 @@ def test_write_phy(test_dataframes,tmpdir):
     io.write_phy(df,out_file)
     _check_output_file(out_file)
 
-    # -------------------------------------------------------------------------
-    # output files
-
-    bad_output_files = [None,1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                        str,(1,2)]
-    for b in bad_output_files:
-        with pytest.raises(ValueError):
-            io.write_phy(df,b)
-
     # -------------------------------------------------------------------------
     # seq_column
 
@@ -235,30 +234,20 @@ def test_write_phy(test_dataframes,tmpdir):
     assert has_gaps
 
     os.remove(out_file)
-    bad_seq_columns = [1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                        str,(1,2),"not_in_df"]
-    for b in bad_seq_columns:
-        print("trying",b)
-        with pytest.raises(ValueError):
-            io.write_phy(df,out_file=out_file,seq_column=b)
 
     # Send in alignment column with a short sequence (not all same length)
-    bad_align_df = df.copy()
-    bad_align_df.loc[0,"alignment"] = "MTG"
+    new_alignment = df["alignment"].copy()
+    new_alignment.loc[0] = "MTG"
+    bad_align_df = df.assign(alignment=new_alignment)
     with pytest.raises(ValueError):
         io.write_phy(bad_align_df,out_file=out_file,seq_column="alignment")
 
     # -------------------------------------------------------------------------
     # write_only_keepers
 
-    bad_write_only = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_write_only:
-        with pytest.raises(ValueError):
-            io.write_phy(df,out_file=out_file,write_only_keepers=b)
-
-    no_keep_df = df.copy()
-    no_keep_df.loc[1:,"keep"] = False
+    new_keep = df["keep"].copy()
+    new_keep.loc[1:] = False
+    no_keep_df = df.assign(keep=new_keep)
     io.write_phy(no_keep_df,out_file,write_only_keepers=True)
     has_gaps = _check_output_file(out_file,check_length=1)
 
@@ -270,12 +259,6 @@ def test_write_phy(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # empty_char
 
-    bad_empty = [1.0,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                 str,(1,2),True]
-    for b in bad_empty:
-        with pytest.raises(ValueError):
-            io.write_phy(df,out_file=out_file,empty_char=b)
-
     # Should throw runtime error because sequences all look empty!
     with pytest.raises(RuntimeError):
         io.write_phy(df,out_file=out_file,empty_char="ACDEFGHIKLMNPQRSTVWYZ-")
@@ -283,14 +266,9 @@ def test_write_phy(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # clean_sequence
 
-    bad_clean = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_clean:
-        with pytest.raises(ValueError):
-            io.write_phy(df,out_file=out_file,clean_sequence=b)
-
-    to_clean_df = df.copy()
-    to_clean_df.loc[0,"alignment"] = "?LUFLFF---"
+    new_alignment = df["alignment"].copy()
+    new_alignment.loc[0] = "?LUFLFF---"
+    to_clean_df = df.assign(alignment=new_alignment)
     io.write_phy(to_clean_df,out_file=out_file,clean_sequence=True)
     f = open(out_file)
     lines = f.readlines()
@@ -300,12 +278,6 @@ def test_write_phy(test_dataframes,tmpdir):
     # -------------------------------------------------------------------------
     # overwrite
 
-    bad_overwrite = [None,[1,3,4],{"test":1},pd.DataFrame({"test":[1]}),
-                   str,(1,2),"something"]
-    for b in bad_overwrite:
-        with pytest.raises(ValueError):
-            io.write_phy(df,out_file=out_file,overwrite=b)
-
     os.remove(out_file)
     io.write_phy(df,out_file)
     # Should throw error because overwrite is False by default
@@ -320,6 +292,17 @@ def test_write_phy(test_dataframes,tmpdir):
     io.write_phy(df,out_file,overwrite=True)
 
 
+@pytest.mark.parametrize("arg,bad_value",
+                         _bad_writer_params(["out_file","seq_column",
+                                             "write_only_keepers",
+                                             "empty_char","clean_sequence",
+                                             "overwrite"]))
+def test_write_phy_bad_args(test_dataframes,tmpdir,arg,bad_value):
+
+    df = test_dataframes["good-df_with-good-alignment"]
+    _check_bad_writer_arg(io.write_phy,df,os.path.join(tmpdir,"output.phy"),
+                          arg,bad_value)
+
 def test_read_fasta_into(test_dataframes,tmpdir):
 
     df = test_dataframes["good-df"].copy()
@@ -37,29 +37,20 @@ def test_read_dataframe(dataframe_good_files,test_dataframes):
     df.uid
     df.keep
 
-    # Make sure dies with useful error
-    bad_inputs = [1,-1,1.5,None,False,pd.DataFrame]
-    for b in bad_inputs:
-        with pytest.raises(ValueError):
-            read_dataframe(b)
-
     # Make sure raises file not found if a file is not passed
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError,match="not_really_a_file.txt"):
         read_dataframe("not_really_a_file.txt")
 
-def test_write_dataframe(test_dataframes,tmpdir):
+@pytest.mark.parametrize("bad_input",[1,-1,1.5,None,False,pd.DataFrame])
+def test_read_dataframe_bad_input(bad_input):
 
-    df = test_dataframes["good-df"]
+    # Make sure dies with useful error
+    with pytest.raises(ValueError,match="not recognized"):
+        read_dataframe(bad_input)
 
-    bad_df = [pd.DataFrame,pd.DataFrame({"test":[1]}),None,1,"string",str]
-    for b in bad_df:
-        with pytest.raises(ValueError):
-            write_dataframe(b,"output_file.csv")
+def test_write_dataframe(test_dataframes,tmpdir):
 
-    bad_out_file = [pd.DataFrame,pd.DataFrame({"test":[1]}),None,1,str]
-    for b in bad_out_file:
-        with pytest.raises(ValueError):
-            write_dataframe(df,b)
+    df = test_dataframes["good-df"]
 
     def _check_written_out(df,out,sep):
         assert os.path.isfile(out)
@@ -89,3 +80,22 @@ def test_write_dataframe(test_dataframes,tmpdir):
     out = os.path.join(tmpdir,"some_file.xlsx")
     write_dataframe(df,out_file=out)
     assert os.path.exists(out)
+
+@pytest.mark.parametrize("bad_df",
+                         [pd.DataFrame,
+                          pytest.param(pd.DataFrame({"test":[1]}),id="single_col_df"),
+                          None,1,"string",str])
+def test_write_dataframe_bad_df(tmpdir,bad_df):
+
+    with pytest.raises(ValueError,match="dataframe"):
+        write_dataframe(bad_df,os.path.join(tmpdir,"output_file.csv"))
+
+@pytest.mark.parametrize("bad_out_file",
+                         [pd.DataFrame,
+                          pytest.param(pd.DataFrame({"test":[1]}),id="single_col_df"),
+                          None,1,str])
+def test_write_dataframe_bad_out_file(test_dataframes,bad_out_file):
+
+    df = test_dataframes["good-df"]
+    with pytest.raises(ValueError,match="out_file"):
+        write_dataframe(df,bad_out_file)
@@ -7,6 +7,7 @@ from topiary.ncbi.blast.read import records_to_df
 from topiary.ncbi.blast.read import read_blast_xml
 
 import os, shutil, re
+from unittest import mock
 
 def test__clean_xml(user_xml_files):
 
@@ -91,6 +92,16 @@ def test_read_blast_xml(xml,tmpdir,user_xml_files):
     assert len(df[1]) == 19
     assert xml_files[0] == xml_file
     assert xml_files[1] == xml_file
+    assert df[0] is not df[1]
+
+    # The same file passed twice in one call is only parsed once
+    with mock.patch("topiary.ncbi.blast.read._xml_file_to_records",
+                    wraps=_xml_file_to_records) as parse_mock:
+        df, xml_files = read_blast_xml([xml_file,xml_file])
+    assert parse_mock.call_count == 1
+    assert len(df) == 2
+    assert df[0] is not df[1]
+    assert df[0].equals(df[1])
 
     # Pass directory with an xml file
     xml_files_dir = os.path.join(tmpdir,"xml_files")
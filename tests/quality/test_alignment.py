@@ -2,10 +2,11 @@
 import pytest
 
 import topiary
-from topiary.quality.alignment import _get_sparse_columns, _rle, _drop_gaps_only
+from topiary.quality.alignment import _rle, _drop_gaps_only
 #from topiary.quality.alignment import _find_too_many_sparse, _find_too_few_dense
 #from topiary.quality.alignment import _find_long_insertions
 from topiary.quality.alignment import AA_TO_INT, INT_TO_AA
+from topiary.quality.alignment import AA_LUT, _build_aa_lut
 from topiary.quality.alignment import score_alignment
 
 import numpy as np
@@ -19,27 +20,27 @@ def data_for_test():
 
     seqs = []
     for i in range(20):
-        seqs.append([AA_TO_INT[g] for g in list(good)])
-    seqs.append([AA_TO_INT[g] for g in list(long)])
-    seqs.append([AA_TO_INT[g] for g in list(short)])
+        seqs.append([AA_TO_INT[g] for g in good])
+    seqs.append([AA_TO_INT[g] for g in long])
+    seqs.append([AA_TO_INT[g] for g in short])
 
     return np.array(seqs)
 
-def test__get_sparse_columns():
+def test__build_aa_lut():
 
-    seqs = data_for_test()
+    assert _build_aa_lut() is AA_LUT
+    assert AA_LUT.dtype == np.uint8
+    assert len(AA_LUT) == 256
 
-    sparse_mask = np.ones(seqs.shape[1],dtype=bool)
-    sparse_mask[:4] = 0
-    sparse_mask[-2] = 0
+    for a in AA_TO_INT:
+        assert AA_LUT[ord(a)] == AA_TO_INT[a]
 
-    sparse = _get_sparse_columns(seqs)
-    assert np.array_equal(sparse,sparse_mask)
+    # Anything else is a gap
+    for a in "acdxXBZ?*.":
+        assert INT_TO_AA[AA_LUT[ord(a)]] == "-"
 
-    sparse = _get_sparse_columns(seqs,sparse_column_cutoff=0.045)
-    sparse_mask = np.ones(seqs.shape[1],dtype=bool)
-    sparse_mask[-2] = 0
-    assert np.array_equal(sparse,sparse_mask)
+    with pytest.raises(ValueError):
+        AA_LUT[0] = 0
 
 def test__rle():
 
@@ -75,4 +76,56 @@ def test__drop_gaps_only():
 
 def test_score_alignment():
 
-    pass
+    good =  "TEST---------------S-"
+    long =  "TESTTHISTHISTHISTHIS-"
+    short = "------------------IS-"
+    aln = [good for _ in range(20)]
+    aln.extend([long,short])
+
+    df = pd.DataFrame({"species":["Homo sapiens" for _ in aln],
+                       "name":[f"protein{i}" for i in range(len(aln))],
+                       "sequence":[a.replace("-","") for a in aln],
+                       "alignment":aln})
+
+    # Last column is gaps only and is dropped. Columns 4-18 are sparse.
+    # Columns 0-3 and 19 are dense.
+    out = score_alignment(df,align_trim=(0,1))
+    assert np.allclose(out["fx_in_sparse"],[0]*20 + [15/20,1/20])
+    assert np.allclose(out["fx_missing_dense"],[0]*20 + [0,4/5])
+    assert np.array_equal(out["sparse_run_length"],[0]*20 + [15,1])
+
+    # Drop cutoff so columns 0-3 (1/22 gaps) are also sparse. Only column 19
+    # is dense.
+    out = score_alignment(df,sparse_column_cutoff=0.045,align_trim=(0,1))
+    assert np.allclose(out["fx_in_sparse"],[4/20]*20 + [19/20,1/20])
+    assert np.allclose(out["fx_missing_dense"],[0]*22)
+    assert np.array_equal(out["sparse_run_length"],[4]*20 + [19,1])
+
+    # Sequences with keep = False are not scored
+    df["keep"] = True
+    df.loc[21,"keep"] = False
+    out = score_alignment(df,align_trim=(0,1))
+    assert len(out) == 21
+    assert np.allclose(out["fx_missing_dense"],[0]*21)
+
+    # Characters that are not amino acids or "-" (including non-ascii
+    # characters) are scored as gaps
+    df["keep"] = True
+    expected = score_alignment(df,align_trim=(0,1))
+    df.loc[20,"alignment"] = "TESTTHISTHISTHISTHISX"
+    df.loc[21,"alignment"] = "?.*Ω~-------------IS-"
+    out = score_alignment(df,align_trim=(0,1))
+    for c in ["fx_in_sparse","fx_missing_dense","sparse_run_length"]:
+        assert np.allclose(out[c],expected[c])
+
+    # Alignment sequences must all be the same length
+    bad_df = df.copy()
+    bad_df.loc[21,"alignment"] = "TEST"
+    with pytest.raises(ValueError):
+        score_alignment(bad_df)
+
+    # Alignment entries must be sequences
+    bad_df = df.copy()
+    bad_df.loc[21,"alignment"] = np.nan
+    with pytest.raises(ValueError,match="could not be interpreted"):
+        score_alignment(bad_df)
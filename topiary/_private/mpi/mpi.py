@@ -55,13 +55,13 @@ def get_num_slots():
                                       check_function_kwargs={"minimum_allowed":1})
 
 
-    # Increase number of slots until mpirun fails
+    # Increase number of slots until mpirun fails. Every slot count returned
+    # has been successfully run with mpirun.
     num_slots = 1
     while True:
 
         try:
             _ = get_hosts(num_slots)
-            num_slots += 1
         except RuntimeError as error:
             num_slots = num_slots - 1
 
@@ -76,14 +76,14 @@ def get_num_slots():
         # Hard cap based on environment variable
         if max_num_slots is not None:
             if num_slots >= max_num_slots:
-                num_slots = max_num_slots
                 break
 
+        num_slots += 1
 
     return num_slots
 
 
-def check_mpi_configuration(num_threads):
+def check_mpi_configuration(num_threads,num_slots=None):
     """
     Make sure mpi configuration allows the requested number of threads.
 
@@ -92,11 +92,22 @@ def check_mpi_configuration(num_threads):
     num_threads : int
         number of threads (e.g. slots) to test. if -1, try to infer the number
         of slots using get_num_slots
+    num_slots : int, optional
+        number of slots already determined by get_num_slots. If specified,
+        this is used rather than calling get_num_slots again. Because
+        get_num_slots already ran mpirun successfully with this many slots,
+        mpirun is not re-run if num_threads <= num_slots.
     """
 
     # if threads were not passed in directly, infer from the environment
     if num_threads == -1:
-        num_threads = get_num_slots()
+        if num_slots is None:
+            num_slots = get_num_slots()
+        num_threads = num_slots
+
+    # Already validated by get_num_slots
+    if num_slots is not None and 1 <= num_threads <= num_slots:
+        return
 
     try:
         get_hosts(num_threads)
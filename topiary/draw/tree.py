@@ -7,13 +7,69 @@ import topiary
 from topiary._private import Supervisor
 from topiary.draw.core import create_name_dict
 from topiary.draw.core import construct_sizemap
+from topiary.draw.core import parse_span_color
 from topiary.io.tree import load_trees
 from topiary.draw.prettytree import PrettyTree
 
 import toyplot
 import numpy as np
 
-import os, copy
+import os, glob
+import functools
+
+@functools.lru_cache(maxsize=8)
+def _cached_load_trees(directory,prefix,newick_stamp):
+    """
+    Cached wrapper around load_trees. newick_stamp should hold the names and
+    modification times of the newick files in directory so the cache is
+    invalidated when any of those files change. Callers should copy the
+    returned tree before modifying it.
+    """
+
+    return load_trees(directory=directory,prefix=prefix)
+
+def _get_newick_stamp(directory):
+    """
+    Get a hashable snapshot ((file,mtime_ns),...) of the newick files in a
+    directory.
+    """
+
+    if directory is None:
+        return ()
+
+    stamp = []
+    for f in glob.glob(os.path.join(directory,"*.newick")):
+        stamp.append((f,os.stat(f).st_mtime_ns))
+    stamp.sort()
+
+    return tuple(stamp)
+
+def _scale_size(size,factor):
+    """
+    Scale a node size by factor, returning a new object rather than modifying
+    size.
+
+    Parameters
+    ----------
+    size : float or list-like or dict
+        node size (see node_size argument to tree)
+    factor : float
+        multiply size by this value
+
+    Returns
+    -------
+    scaled_size : float or numpy.ndarray or dict
+        scaled copy of size. dicts are returned as dicts; list-like inputs are
+        returned as numpy arrays.
+    """
+
+    if issubclass(type(size),dict):
+        return {k:v*factor for k, v in size.items()}
+
+    try:
+        return size*factor
+    except (ValueError,TypeError):
+        return np.array(size)*factor
 
 def tree(calculation,
          output_file=None,
@@ -164,8 +220,14 @@ def tree(calculation,
     # Load a tree with current calculation states (will have event, bs_support,
     # anc_label, anc_pp) on internal nodes. None if those parameters were not
     # calculated in at this point in the pipeline.
-    T = load_trees(directory=supervisor.output_dir,
-                   prefix=supervisor.tree_prefix)
+    # Trees are cached between calls (useful when re-drawing the same
+    # calculation with different aesthetics), so work on a copy.
+    output_dir = supervisor.output_dir
+    T = _cached_load_trees(output_dir,
+                           supervisor.tree_prefix,
+                           _get_newick_stamp(output_dir))
+    if T is not None:
+        T = T.copy()
 
     # If df not specified, get from the previous run
     if df is None:
@@ -200,24 +262,12 @@ def tree(calculation,
         if event_color is not None:
 
             # Make sure node_size, whatever it is, works fine with event
-            prop = []
-            for n in T.traverse():
-                if not n.is_leaf():
-                    prop.append(n.event)
-            prop = list(set(prop))
+            prop = list({n.event for n in T.traverse() if not n.is_leaf()})
             sm, sm_span = construct_sizemap(node_size,prop)
 
             # Now update the size so it's slightly bigger than requested for
             # the event
-            this_size = copy.deepcopy(node_size)
-            if issubclass(type(this_size),dict):
-                for k in this_size:
-                    this_size[k] = this_size[k]*1.5
-            else:
-                try:
-                    this_size = this_size*1.5
-                except (ValueError,TypeError):
-                    this_size = np.array(this_size)*1.5
+            this_size = _scale_size(node_size,1.5)
 
             pt.draw_nodes(property_label="event",
                           color=event_color,
@@ -227,7 +277,7 @@ def tree(calculation,
         # Plot bootstrap supports
         if bs_color is not None:
 
-            plot_bs, bs_span, bs_color = topiary.draw.core.parse_span_color(bs_color,node_color)
+            plot_bs, bs_span, bs_color = parse_span_color(bs_color,node_color)
             pt.draw_nodes(property_label="bs_support",
                           prop_span=bs_span,
                           color=bs_color,
@@ -236,19 +286,11 @@ def tree(calculation,
             # If we successfully plotted bootstraps decrease node_size by factor
             # so we can plot next data
             if "bs_support" in pt.plotted_properties:
-
-                if issubclass(type(node_size),dict):
-                    for k in node_size:
-                        node_size[k] = node_size[k]*0.6
-                else:
-                    try:
-                        node_size = node_size*0.6
-                    except (ValueError,TypeError):
-                        node_size = np.array(node_size)*0.6
+                node_size = _scale_size(node_size,0.6)
 
         # Plot ancestor posterior probabilities
         if pp_color is not None:
-            plot_pp, pp_span, pp_color = topiary.draw.core.parse_span_color(pp_color,node_color)
+            plot_pp, pp_span, pp_color = parse_span_color(pp_color,node_color)
             pt.draw_nodes(property_label="anc_pp",
                           prop_span=pp_span,
                           color=pp_color,
@@ -15,8 +15,35 @@ from ._generax import GENERAX_BINARY
 from topiary.raxml import RAXML_BINARY
 
 import subprocess
+import functools
+import shutil
 import os
 
+@functools.lru_cache(maxsize=None)
+def _assert_binary_available(binary,name):
+    """
+    Make sure a binary is available, raising a ValueError if it is not. The
+    result is cached so the check only runs once per binary.
+
+    Parameters
+    ----------
+    binary : str
+        binary to check
+    name : str
+        name of the program (i.e. "generax") for the error message
+    """
+
+    # Look for the binary without spawning a process. If this fails, fall back
+    # to trying to run it.
+    if shutil.which(binary) is not None:
+        return
+
+    try:
+        subprocess.run([binary],capture_output=True)
+    except FileNotFoundError:
+        err = f"\n{name} binary '{binary}' not found in path\n\n"
+        raise ValueError(err)
+
 def reconcile(prev_calculation=None,
               df=None,
               model=None,
@@ -101,26 +128,18 @@ def reconcile(prev_calculation=None,
         None.
     """
 
-    # Make sure that generax is in the path
-    try:
-        subprocess.run([generax_binary],capture_output=True)
-    except FileNotFoundError:
-        err = f"\ngenerax binary '{generax_binary}' not found in path\n\n"
-        raise ValueError(err)
-
-    # Make sure that raxml is in the path
-    try:
-        subprocess.run([raxml_binary],capture_output=True)
-    except FileNotFoundError:
-        err = f"\nraxml binary '{raxml_binary}' not found in path\n\n"
-        raise ValueError(err)
+    # Make sure that generax and raxml are in the path
+    _assert_binary_available(generax_binary,"generax")
+    _assert_binary_available(raxml_binary,"raxml")
 
     # Get number of slots
+    num_slots = None
     if num_threads == -1:
-        num_threads = get_num_slots()
+        num_slots = get_num_slots()
+        num_threads = num_slots
 
     # Check sanity of mpi configuration/number of slots
-    check_mpi_configuration(num_threads)
+    check_mpi_configuration(num_threads,num_slots=num_slots)
 
     # --------------------------------------------------------------------------
     # Load/parse calculation inputs
@@ -184,7 +203,8 @@ def reconcile(prev_calculation=None,
     else:
 
         try:
-            prev_calc_type = supervisor.previous_entries[-1]["calc_type"]
+            last_entry = supervisor.previous_entries[-1]
+            prev_calc_type = last_entry["calc_type"]
         except:
             prev_calc_type = None
 
@@ -194,11 +214,11 @@ def reconcile(prev_calculation=None,
             raise ValueError(err)
 
         # Make sure bootstrap directory exists
-        bs_dir = os.path.join(supervisor.previous_entries[-1]["calc_dir"],
-                              "output","bootstrap_replicates")
+        prev_calc_dir = last_entry["calc_dir"]
+        bs_dir = os.path.join(prev_calc_dir,"output","bootstrap_replicates")
 
         if not os.path.isdir(bs_dir):
-            err = f"\ninput directory '{supervisor.previous_entries[-1]['calc_dir']}'\n"
+            err = f"\ninput directory '{prev_calc_dir}'\n"
             err += "does not have an output/bootstrap_replicates directory. Was\n"
             err += "this calculation run with bootstrap=True?\n\n"
             raise FileNotFoundError(err)
@@ -46,7 +46,7 @@ def _validate_seq_writer(df,
         if type(seq_column) is dict:
             raise TypeError
         df.loc[:,seq_column]
-    except (KeyError,TypeError):
+    except (KeyError,TypeError,ValueError):
         err = f"seq_column '{seq_column}' not found\n."
         raise ValueError(err)
 
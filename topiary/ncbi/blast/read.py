@@ -241,10 +241,14 @@ def read_blast_xml(xml_input,do_cpu_check=False):
             if check_for_cpu_limit(x):
                 return None, xml_files
 
-    # Actually parse xml files
+    # Actually parse xml files. Keep parsed records for this call so the same
+    # file is not re-parsed if it is passed in more than once.
+    parsed = {}
     all_df = []
     for x in xml_files:
-        records = _xml_file_to_records(x)
-        all_df.append(records_to_df(records))
+        key = os.path.abspath(x)
+        if key not in parsed:
+            parsed[key] = _xml_file_to_records(x)
+        all_df.append(records_to_df(parsed[key]))
 
     return all_df, xml_files
@@ -8,37 +8,34 @@ from topiary._private import check
 import pandas as pd
 import numpy as np
 
-import re
+import functools
 
 # structures to convert amino acid sequences to integers and back
 AA = "ACDEFGHIKLMNPQRSTVWY-"
 AA_TO_INT = dict([(a,i) for i, a in enumerate(AA)])
 INT_TO_AA = list(AA)
 
-def _get_sparse_columns(seqs,sparse_column_cutoff=0.80):
+@functools.lru_cache(maxsize=None)
+def _build_aa_lut():
     """
-    Get True/False array for whether each column is less than cutoff % gaps.
+    Build a lookup table mapping ascii byte values to integers. Any byte that
+    is not in AA maps to the gap integer.
 
-    Parameters
-    ----------
-    seqs : numpy.ndarray
-        2D numpy array holding sequences represented as integers
-    sparse_column_cutoff : float, default=0.80
-        column is sparse if it has > sparse_column_cutoff fraction gap
-
-    Return
-    ------
-        True/False numpy array mask
+    Returns
+    -------
+    aa_lut : numpy.ndarray
+        uint8 array of length 256 indexed by byte value
     """
 
-    column_scores = []
-    for c in range(seqs.shape[1]):
-        column_scores.append(np.sum(seqs[:,c] == 20)/seqs.shape[0])
-    column_scores = np.array(column_scores)
+    aa_lut = np.full(256,AA_TO_INT["-"],dtype=np.uint8)
+    aa_lut[[ord(a) for a in AA]] = np.arange(len(AA),dtype=np.uint8)
 
-    sparse_columns = column_scores >= sparse_column_cutoff
+    # Cached and shared, so do not allow it to be modified
+    aa_lut.flags.writeable = False
 
-    return sparse_columns
+    return aa_lut
+
+AA_LUT = _build_aa_lut()
 
 def _rle(input_array):
     """
@@ -69,22 +66,23 @@ def _rle(input_array):
     # Get differences in input array
     diffs = input_array[1:] != input_array[:-1]
 
+    # Get the indexes where the sequences differ from each other.
+    idx = np.flatnonzero(diffs)
+
     # Build array to hold indexes of differences. Stick -1 at front and
     # len(input_array) -1 at back so we count from start and end.
-    diff_indexes = np.zeros(np.sum(diffs) + 2,dtype=int)
+    diff_indexes = np.empty(idx.size + 2,dtype=np.intp)
     diff_indexes[0] = -1
     diff_indexes[-1] = N - 1
-
-    # Get the indexes where the sequences differ from each other.
-    diff_indexes[1:-1] = np.where(diffs)[0]
+    diff_indexes[1:-1] = idx
 
     # Get lengths of jumps between indexes
     run_lengths = np.diff(diff_indexes)
 
-    # Start positions array. Append 0 on front -- first always starts at zero.
-    # Don't include last index -- not a start.
-    start_positions = np.zeros(run_lengths.shape[0],dtype=int)
-    start_positions[1:] = np.cumsum(run_lengths[:-1])
+    # Each run starts one after the previous difference. Because of the -1 on
+    # the front, the first run starts at zero. Don't include last index -- not
+    # a start.
+    start_positions = diff_indexes[:-1] + 1
 
     # These are the values of each of the runs
     values = input_array[diff_indexes[1:]]
@@ -107,15 +105,7 @@ def _drop_gaps_only(seqs):
     """
 
     # Create True/False mask for columns with more than just "-"
-    not_just_gaps = []
-    for i in range(seqs.shape[1]):
-        u = np.unique(seqs[:,i])
-        if len(u) == 1 and u[0] == 20:
-            not_just_gaps.append(False)
-        else:
-            not_just_gaps.append(True)
-
-    not_just_gaps = np.array(not_just_gaps,dtype=bool)
+    not_just_gaps = np.logical_not(np.all(seqs == 20,axis=0))
 
     # Whack out columns that are only "-"
     seqs = seqs[:,not_just_gaps]
@@ -168,7 +158,8 @@ def score_alignment(df,
     # check dataframe
     df = check.check_topiary_dataframe(df)
 
-    df = df.loc[df.keep,:]
+    # Only score sequences with keep = True
+    df = df.loc[df.keep,:].copy()
 
     # Check for alignment. If not done, align sequences using muscle super5.
     try:
@@ -177,18 +168,23 @@ def score_alignment(df,
         df = topiary.align(df,super5=True,silent=silent)
         aln = df.loc[:,"alignment"]
 
-    # Get length of sequence column
+    # Get length of sequence column. Non-string entries either make the .str
+    # accessor fail (no strings at all) or give NaN lengths.
     try:
-        col_lengths = list(set([len(s) for s in aln]))
-        if len(col_lengths) != 1:
-            err = f"\nall sequences in 'alignment' column do not have the same legnth\n\n"
-            raise ValueError(err)
-        align_length = col_lengths[0]
+        lengths = aln.str.len().to_numpy()
+        not_sequences = np.any(pd.isna(lengths))
+    except AttributeError:
+        not_sequences = True
 
-    except TypeError:
+    if not_sequences:
         err = f"\n'alignment' column could not be interpreted as sequences\n\n"
         raise ValueError(err)
 
+    if len(lengths) == 0 or np.any(lengths != lengths[0]):
+        err = f"\nall sequences in 'alignment' column do not have the same legnth\n\n"
+        raise ValueError(err)
+    align_length = int(lengths[0])
+
     # Check float inputs
     sparse_column_cutoff = check.check_float(sparse_column_cutoff,
                                                          "sparse_column_cutoff",
@@ -222,50 +218,60 @@ def score_alignment(df,
         else:
             back_index += 1
 
-    # Generate an array of sequences as integers.
-    seqs = []
-    for i in df.index:
-        if not df.loc[i,"keep"]:
-            continue
-        this_seq = re.sub(f"[^{AA}]","-",df.loc[i,"alignment"][front_index:back_index])
-        seqs.append([AA_TO_INT[c] for c in list(this_seq)])
-
-    seqs = np.array(seqs,dtype=int)
+    # Generate an array of sequences as integers. There are only 21 states, so
+    # store as uint8 to keep the array (and the passes over it below) small.
+    # All sequences have the same length, so join the trimmed sequences,
+    # convert them in one pass, and reshape into a (num_seqs,num_columns)
+    # array. Converting with AA_LUT also converts any character not in AA
+    # (including non-ascii characters, which become "?") to a gap.
+    trimmed = "".join([s[front_index:back_index] for s in aln.to_numpy()])
+    trimmed = trimmed.encode("ascii",errors="replace")
+    seqs = AA_LUT[np.frombuffer(trimmed,dtype=np.uint8)]
+    seqs = seqs.reshape((len(aln),-1))
 
     # Drop gaps only columns
     seqs = _drop_gaps_only(seqs)
 
-    sparse_columns = _get_sparse_columns(seqs,sparse_column_cutoff)
-    non_gap_sparse = np.logical_and(seqs != 20,sparse_columns)
-    fx_in_sparse = np.sum(non_gap_sparse,axis=1)/seqs.shape[1]
+    # Build the gap mask once and derive all scores from it rather than
+    # re-comparing the whole alignment for each score.
+    is_gap = seqs == 20
 
+    # A column is sparse if the fraction of gaps is >= sparse_column_cutoff
+    sparse_columns = np.sum(is_gap,axis=0)/seqs.shape[0] >= sparse_column_cutoff
     dense_columns = np.logical_not(sparse_columns)
-    gap_dense = np.logical_and(seqs == 20,dense_columns)
-    fx_missing_dense = np.sum(gap_dense,axis=1)/np.sum(dense_columns)
 
+    # Count gaps per sequence in all columns and in sparse columns only. Gaps
+    # in dense columns and non-gaps in sparse columns follow from these
+    # without building masked copies of the whole alignment.
+    num_sparse = np.count_nonzero(sparse_columns)
+    num_dense = seqs.shape[1] - num_sparse
+    total_gaps = np.count_nonzero(is_gap,axis=1)
+    sparse_is_gap = is_gap[:,sparse_columns]
+    sparse_gaps = np.count_nonzero(sparse_is_gap,axis=1)
+
+    fx_in_sparse = (num_sparse - sparse_gaps)/seqs.shape[1]
+    fx_missing_dense = (total_gaps - sparse_gaps)/num_dense
+
+    # Count the non-gap characters each sequence has in every run of sparse
+    # columns with a single reduceat call over the sparse columns only. In
+    # that array, each sparse run starts where the previous one ended. If there
+    # are no sparse columns, every run length is zero.
     sparse_run_length = np.zeros(len(seqs))
-    run_lengths, start_positions, values = _rle(dense_columns)
-    for i in range(len(run_lengths)):
-
-        # If the this is a run of sparse columns
-        if values[i] == False:
+    if num_sparse > 0:
 
-            # Grab indexes for start and stop of sparse column run
-            s = start_positions[i]
-            e = s + run_lengths[i]
+        run_lengths, _, values = _rle(dense_columns)
+        sparse_run_lengths = run_lengths[np.logical_not(values)]
+        bins = np.zeros(len(sparse_run_lengths),dtype=int)
+        bins[1:] = np.cumsum(sparse_run_lengths[:-1])
 
-            # Go through every sequence
-            for j in range(len(seqs)):
-                in_sparse_run = np.sum(seqs[j,s:e] != 20)
-                if in_sparse_run > sparse_run_length[j]:
-                    sparse_run_length[j] = in_sparse_run
+        # Accumulate in the smallest integer type that can hold a whole run
+        counts = np.add.reduceat(np.logical_not(sparse_is_gap),bins,axis=1,
+                                 dtype=np.min_scalar_type(num_sparse))
+        sparse_run_length[:] = np.max(counts,axis=1)
 
     # Load quality data into the dataframe
-    df["fx_in_sparse"] = np.nan
-    df.loc[df.keep,"fx_in_sparse"] = fx_in_sparse
-    df["fx_missing_dense"] = np.nan
-    df.loc[df.keep,"fx_missing_dense"] = fx_missing_dense
-    df["sparse_run_length"] = np.nan
-    df.loc[df.keep,"sparse_run_length"] = sparse_run_length
+    df["fx_in_sparse"] = fx_in_sparse
+    df["fx_missing_dense"] = fx_missing_dense
+    df["sparse_run_length"] = sparse_run_length
 
     return df